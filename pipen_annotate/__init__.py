@@ -1,4 +1,55 @@
-from .annotate import annotate  # noqa: F401
-from .sections import Section  # noqa: F401
+import sys
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:  # pragma: no cover
+    from .annotate import annotate  # noqa: F401
+    from .sections import Section  # noqa: F401
 
 version = "0.14.1"
+
+
+class _Module(ModuleType):
+    """Keep `pipen_annotate.annotate` bound to the function.
+
+    When the submodule is imported first (`import
+    pipen_annotate.annotate`), the import system binds the package
+    attribute to the module, shadowing the function for a later
+    `from pipen_annotate import annotate`. A data descriptor wins over
+    the instance dict, so the property resolves to the function in
+    either import order, while still deferring the heavy
+    pipen/diot/liquid import chain until the API is first used.
+    """
+
+    @property
+    def annotate(self):
+        fn = self.__dict__.get("_annotate")
+        if fn is None:
+            from .annotate import annotate as fn
+
+            self.__dict__["_annotate"] = fn
+        return fn
+
+    @annotate.setter
+    def annotate(self, value):
+        # Drop the submodule binding made by the import system; the
+        # package exports the function of the same name
+        if not isinstance(value, ModuleType):
+            self.__dict__["_annotate"] = value
+
+
+def __getattr__(name: str):
+    # Defer the import of the section machinery until it is actually
+    # used, so `import pipen_annotate` stays cheap
+    if name == "Section":
+        from .sections import Section
+
+        globals()["Section"] = Section
+        return Section
+
+    raise AttributeError(
+        f"module {__name__!r} has no attribute {name!r}"
+    )
+
+
+sys.modules[__name__].__class__ = _Module
@@ -1,15 +1,23 @@
 from __future__ import annotations
 
-import textwrap
+import re
+import sys
 from abc import ABC
-from typing import Any, Callable, Mapping, Type, MutableMapping
+from functools import lru_cache
+from typing import Any, Callable, Mapping, Tuple, Type, MutableMapping
+from weakref import WeakKeyDictionary
 
 from diot import OrderedDiot
 from liquid import Liquid
 from pipen import Proc, ProcGroup
-from pipen.utils import mark, get_marked
+from pipen.utils import get_marked
 
-from .utils import indent as indent_text, FORMAT_INDENT, is_section
+from .utils import (
+    indent as indent_text,
+    FORMAT_INDENT,
+    dedent_text,
+    is_section,
+)
 from .sections import (
     Section,
     SectionSummary,
@@ -39,6 +47,95 @@ SECTION_TYPES: MutableMapping[str, Type[Section]] = {
     "Items": SectionItems,
 }
 
+# Registered section names, kept in sync with SECTION_TYPES, for fast
+# membership tests in the tokenizer; the names are interned so the
+# tests are pointer comparisons most of the time
+_SECTION_NAMES = frozenset(map(sys.intern, SECTION_TYPES))
+
+# Cache the fully-resolved annotations per class, weakly, so that
+# dynamically created classes don't leak
+_ANNOTATE_CACHE: WeakKeyDictionary = WeakKeyDictionary()
+
+# Sentinel to distinguish missing keys from falsy values
+_MISSING = object()
+
+# Indent strings per indent level, so rendering many docstrings with
+# the same level doesn't rebuild the same string
+_INDENT_STRS: dict = {}
+
+# Docstrings are shared across subclasses frequently; dedenting the
+# same string over and over is pure waste
+_dedent_cached = lru_cache(maxsize=1024)(dedent_text)
+
+# Matches a non-indented `<name>:` line, a candidate section header.
+# The name still needs to be validated against SECTION_TYPES/is_section.
+_HEADER_SCAN = re.compile(r"^(\S.*):[ \t]*$", re.MULTILINE)
+
+
+@lru_cache(maxsize=256)
+def _compile_liquid(docstr: str) -> Liquid:
+    """Compile a docstring into a Liquid template, cached per source."""
+    return Liquid(docstr, from_file=False)
+
+
+# Classes that never contribute annotations or docstrings themselves
+_EXCLUDED_MRO = frozenset({object, Proc, ProcGroup, ABC})
+
+
+@lru_cache(maxsize=4096)
+def _first_base(cls: type) -> type | None:
+    """The first ancestor that can contribute annotations, cached."""
+    for mro in cls.__mro__[1:]:
+        if mro not in _EXCLUDED_MRO:
+            return mro
+    return None
+
+
+@lru_cache(maxsize=4096)
+def _is_proc(cls: type) -> bool:
+    """Check if a class is a Proc subclass, cached per class."""
+    return issubclass(cls, Proc)
+
+
+@lru_cache(maxsize=4096)
+def _is_procgroup(cls: type) -> bool:
+    """Check if a class is a ProcGroup subclass, cached per class."""
+    return issubclass(cls, ProcGroup)
+
+
+@lru_cache(maxsize=1024)
+def _tokenize_docstring(docstring: str) -> Tuple[Tuple[str, str], ...]:
+    """Split a docstring into (section name, section body) pairs.
+
+    The result only depends on the docstring and the registered section
+    names, so it is cached; the cache is cleared when a section is
+    (un)registered.
+
+    Args:
+        docstring: The dedented docstring to be tokenized.
+
+    Returns:
+        A tuple of (section name, section body) pairs.
+    """
+    tokens = []
+    section_name = "Summary"
+    pos = 0
+    # Scan for the section headers in one pass instead of testing
+    # every line for a trailing colon
+    for matched in _HEADER_SCAN.finditer(docstring):
+        name = matched.group(1)
+        if name not in _SECTION_NAMES and not is_section(name):
+            # Not a section header, stays in the current section
+            continue
+
+        tokens.append((section_name, docstring[pos:matched.start()]))
+        # Interned: the name is used as a dict key repeatedly downstream
+        section_name = sys.intern(name)
+        pos = matched.end() + 1
+
+    tokens.append((section_name, docstring[pos:]))
+    return tuple(tokens)
+
 
 def _annotate_uninherited(cls: type) -> OrderedDiot:
     """Annotate a Proc class with docstring, without inheriting from base.
@@ -49,61 +146,60 @@ def _annotate_uninherited(cls: type) -> OrderedDiot:
     Returns:
         The annotated dict.
     """
-    annotated = OrderedDiot(diot_nest=False)
     docstring = cls.__doc__
+    if docstring is None and not _is_proc(cls) and not _is_procgroup(cls):
+        # Nothing to parse and no sections to default; still hand out
+        # a fresh diot, since annotations are cached and mutable
+        return OrderedDiot(diot_nest=False)
+
+    # Accumulate in a plain dict (insertion-ordered) and only wrap in
+    # an OrderedDiot once at the end, to skip diot's __setattr__
+    # machinery per section
+    annotated: dict = {}
 
     if docstring:
         if docstring[0] in (" ", "\t"):
-            docstring = textwrap.dedent(docstring)
+            docstring = _dedent_cached(docstring)
         else:
-            parts = docstring.split("\n", 1)
-            if len(parts) == 1:
-                first, rest = parts[0], ""
-            else:
-                first, rest = parts
-            docstring = f"{first}\n{textwrap.dedent(rest)}"
-
-        section_name = "Summary"
-        section = SectionSummary(cls, section_name)
-        for line in docstring.splitlines():
-            line = line.rstrip()
-            if line and line[-1] == ":":
-                if line[:-1] in SECTION_TYPES:
-                    annotated[section_name] = section.parse()
-                    section_name = line[:-1]
-                    if section_name == "Args" and issubclass(cls, ProcGroup):
-                        section = SectionProcGroupArgs(cls, section_name)
-                    else:
-                        section = SECTION_TYPES[section_name](
-                            cls,
-                            section_name,
-                        )
-                elif is_section(line[:-1]):
-                    annotated[section_name] = section.parse()
-                    section_name = line[:-1]
-                    section = SectionText(cls, section_name)
-                else:
-                    section.consume(line)
+            first, sep, rest = docstring.partition("\n")
+            docstring = f"{first}\n{_dedent_cached(rest)}" if sep else first
+
+        if "\n" not in docstring and not docstring.rstrip(" \t").endswith(
+            ":"
+        ):
+            # A one-line docstring that can't be a section header is
+            # all summary; no need to scan for headers
+            tokens: Tuple[Tuple[str, str], ...] = (("Summary", docstring),)
+        else:
+            tokens = _tokenize_docstring(docstring)
+
+        for section_name, body in tokens:
+            section_class = SECTION_TYPES.get(section_name)
+            if section_class is None:
+                section = SectionText(cls, section_name)
+            elif section_name == "Args" and _is_procgroup(cls):
+                section = SectionProcGroupArgs(cls, section_name)
             else:
-                section.consume(line)
+                section = section_class(cls, section_name)
 
-        annotated[section_name] = section.parse()
+            section.consume_block(body)
+            annotated[section_name] = section.parse()
 
-    if issubclass(cls, Proc):
+    if _is_proc(cls):
         if "Summary" not in annotated:
-            annotated.Summary = SectionSummary(cls, "Summary").parse()
+            annotated["Summary"] = SectionSummary(cls, "Summary").parse()
         if "Input" not in annotated:
-            annotated.Input = SectionInput(cls, "Input").parse()
+            annotated["Input"] = SectionInput(cls, "Input").parse()
         if "Output" not in annotated:
-            annotated.Output = SectionOutput(cls, "Output").parse()
+            annotated["Output"] = SectionOutput(cls, "Output").parse()
         if "Envs" not in annotated:
-            annotated.Envs = SectionEnvs(cls, "Envs").parse()
+            annotated["Envs"] = SectionEnvs(cls, "Envs").parse()
 
-    if issubclass(cls, ProcGroup):
+    if _is_procgroup(cls):
         if "Args" not in annotated:
-            annotated.Args = SectionProcGroupArgs(cls, "Args").parse()
+            annotated["Args"] = SectionProcGroupArgs(cls, "Args").parse()
 
-    return annotated
+    return OrderedDiot(annotated, diot_nest=False)
 
 
 def _update_annotation(
@@ -114,16 +210,19 @@ def _update_annotation(
     if base is None:
         return other
 
-    base = other.__class__(base, diot_nest=False)
-
+    # Copy even when other is empty: the result becomes another
+    # class's cache entry and return value, so no two classes may
+    # share one mutable annotation
+    copied = other.__class__(base, diot_nest=False)
     for key, value in other.items():
+        existing = copied.get(key, _MISSING)
         section_class = SECTION_TYPES.get(key)
-        if key not in base or section_class is None:
-            base[key] = value
+        if existing is _MISSING or section_class is None:
+            copied[key] = value
         else:
-            base[key] = section_class.update_parsed(base[key], value)
+            copied[key] = section_class.update_parsed(existing, value)
 
-    return base
+    return copied
 
 
 def annotate(cls: Type[Any]) -> OrderedDiot:
@@ -135,28 +234,36 @@ def annotate(cls: Type[Any]) -> OrderedDiot:
     Returns:
         The annotated dict.
     """
-    annotated = get_marked(cls, "annotate_annotated")
-    inherit = get_marked(cls, "annotate_inherit", True)
-    is_proc_or_pg = issubclass(cls, Proc) or issubclass(cls, ProcGroup)
-
-    if not annotated or not is_proc_or_pg:
-        annotated = _annotate_uninherited(cls)
-        base = [
-            mro
-            for mro in cls.__mro__
-            if (
-                mro is not cls
-                and mro is not object
-                and mro is not Proc
-                and mro is not ProcGroup
-                and mro is not ABC
-            )
-        ]
-
-        base = base[0] if base else None
-        annotated_base = annotate(base) if inherit and base else None
-        annotated = _update_annotation(annotated_base, annotated)
-        mark(annotate_annotated=annotated)(cls)
+    # Walk the base chain iteratively rather than recursing: collect
+    # the classes to annotate leaf -> root, stopping at a cached
+    # ancestor or a class that opts out of inheritance
+    chain = []
+    annotated = None
+    node: type | None = cls
+    while node is not None:
+        try:
+            annotated = _ANNOTATE_CACHE[node]
+            break
+        except (KeyError, TypeError):
+            pass
+
+        chain.append(node)
+        if not get_marked(node, "annotate_inherit", True):
+            break
+
+        node = _first_base(node)
+
+    # Fold the annotations root -> leaf, caching every level
+    for node in reversed(chain):
+        annotated = _update_annotation(
+            annotated,
+            _annotate_uninherited(node),
+        )
+        try:
+            _ANNOTATE_CACHE[node] = annotated
+        except TypeError:  # pragma: no cover
+            # Classes that can't be weakly referenced
+            pass
 
     return annotated
 
@@ -183,15 +290,21 @@ def _register_section(
         return lambda cls: _register_section(section, cls)
 
     if isinstance(section_class, str):
-        section_class = section_class.title()
-        if section_class not in SECTION_TYPES:
+        shortcut = section_class.title()
+        section_class = SECTION_TYPES.get(shortcut)
+        if section_class is None:
             raise ValueError(
-                f"Invalid section class shortcut: {section_class}\n"
+                f"Invalid section class shortcut: {shortcut}\n"
                 f"Valid shortcuts: {', '.join(SECTION_TYPES)}",
             ) from None
-        section_class = SECTION_TYPES[section_class]
 
-    SECTION_TYPES[section] = section_class
+    global _SECTION_NAMES
+
+    SECTION_TYPES[sys.intern(section)] = section_class
+    _SECTION_NAMES = frozenset(SECTION_TYPES)
+    # The section may appear in docstrings parsed earlier
+    _ANNOTATE_CACHE.clear()
+    _tokenize_docstring.cache_clear()
     return section_class
 
 
@@ -201,7 +314,12 @@ def _unregister_section(section: str) -> None:
     Args:
         section: The section name.
     """
+    global _SECTION_NAMES
+
     SECTION_TYPES.pop(section, None)
+    _SECTION_NAMES = frozenset(SECTION_TYPES)
+    _ANNOTATE_CACHE.clear()
+    _tokenize_docstring.cache_clear()
 
 
 def _format_doc(
@@ -233,22 +351,13 @@ def _format_doc(
         return lambda c: _format_doc(c, base=base, indent=indent, vars=vars)
 
     if base is None:
-        base = [
-            mro
-            for mro in cls.__mro__
-            if mro is not cls
-            and mro is not object
-            and mro is not Proc
-            and mro is not ProcGroup
-        ]
-
-        base = base[0] if base else None
+        base = _first_base(cls)
 
     if base is None:
         return cls
 
     if isinstance(indent, int):
-        indent = FORMAT_INDENT * indent
+        indent = _INDENT_STRS.setdefault(indent, FORMAT_INDENT * indent)
 
     docstr = cls.__doc__
     if docstr is None or not docstr.strip():
@@ -261,7 +370,7 @@ def _format_doc(
 
     base_annotated = annotate(base)
     vars = vars or {}
-    docstr = Liquid(docstr, from_file=False).render(**base_annotated, **vars)
+    docstr = _compile_liquid(docstr).render(**base_annotated, **vars)
     cls.__doc__ = indent_text(docstr, indent)
 
     return cls
@@ -1,10 +1,10 @@
 from __future__ import annotations
 from abc import ABC, abstractmethod
-from typing import Any, List, Mapping, MutableMapping
+from typing import Any, List, Mapping, MutableMapping, Tuple
 
 import re
 import warnings
-from copy import deepcopy
+from functools import lru_cache
 
 from diot import Diot, OrderedDiot
 from pipen.defaults import ProcInputType
@@ -12,6 +12,7 @@ from pipen.defaults import ProcInputType
 from .utils import (
     FORMAT_INDENT,
     dedent,
+    dedent_and_clean,
     end_of_sentence,
     cleanup_empty_lines,
 )
@@ -19,7 +20,18 @@ from .utils import (
 ITEM_LINE_REGEX = re.compile(
     r"^(?P<name>[^\s]+)\s*(?:\((?P<attrs>.+?)\))?:(?P<help>.+)?$"
 )
-ITEM_ATTR_REGEX = re.compile(r"^(?P<name>[\w-]+)(?:\s*[:=]\s*(?P<value>.+))?$")
+# ITEM_LINE_REGEX specialized for the `- ` prefix of sub-terms, so the
+# parser doesn't slice the prefix off every line before matching
+ITEM_DASH_LINE_REGEX = re.compile(
+    r"^- (?P<name>[^\s]+)\s*(?:\((?P<attrs>.+?)\))?:(?P<help>.+)?$"
+)
+# Characters that end a sentence for markdown line-break purposes
+_SENTENCE_END = frozenset(".?:!")
+# Scans all `<name>[:=<value>]` attributes of an item in one pass;
+# matches must be contiguous for the attribute string to be valid
+ITEM_ATTRS_SCAN_REGEX = re.compile(
+    r"\s*(?P<name>[\w-]+)(?:\s*[:=]\s*(?P<value>[^;]+?))?\s*(?:;(?!\s*$)|$)"
+)
 
 
 class MalFormattedAnnotationError(Exception):
@@ -56,14 +68,11 @@ class ItemAttrs(Mixin, OrderedDiot):
         self._set_meta("origin", [])
 
     def __str__(self) -> str:
-        out = []
-        for key in self._get_meta("origin"):
-            value = self[key]
-            if value is True:
-                out.append(key)
-            else:
-                out.append(f"{key}={value}")
-        return ";".join(out)
+        getitem = self.__getitem__
+        return ";".join(
+            key if (value := getitem(key)) is True else f"{key}={value}"
+            for key in self._get_meta("origin")
+        )
 
     def to_markdown(self, show_hidden: bool = False) -> str:
         out = str(self)
@@ -85,30 +94,39 @@ def _ipython_to_markdown(lines: List[str]) -> List[str]:
     Returns:
         The converted lines.
     """
-    out = []
+    # The conversion is pure; cache it per distinct block and hand out
+    # a fresh list since callers may extend the result
+    return list(_ipython_to_markdown_cached(tuple(lines)))
+
+
+@lru_cache(maxsize=1024)
+def _ipython_to_markdown_cached(lines: Tuple[str, ...]) -> Tuple[str, ...]:
+    """The cached core of `_ipython_to_markdown`."""
+    out: List[str] = []
+    out_append = out.append
     in_code = False
     for line in lines:
         if line.startswith(">>> "):
             if not in_code:
-                out.append("")
-                out.append("```python")
+                out_append("")
+                out_append("```python")
                 in_code = True
-            out.append(line[4:])
+            out_append(line[4:])
         else:
             if in_code:
-                out.append("```")
-                out.append("")
+                out_append("```")
+                out_append("")
                 in_code = False
 
-            if line and line[-1] in (".", "?", ":", "!"):
-                out.append(line + "<br />")
+            if line and line[-1] in _SENTENCE_END:
+                out_append(line + "<br />")
             else:
-                out.append(line)
+                out_append(line)
 
     if in_code:
-        out.append("```")
-        out.append("")
-    return out
+        out_append("```")
+        out_append("")
+    return tuple(out)
 
 
 class ItemTerm(Mixin, Diot):
@@ -119,50 +137,63 @@ class ItemTerm(Mixin, Diot):
         self._set_meta("raw_help", [])
         self._set_meta("prefix", None)
 
-    def __str__(self) -> str:
-        out = self._get_meta("prefix") or ""
-        out += self.name
-        if self.attrs._get_meta("origin"):
-            out += f" ({self.attrs})"
-        out += ":"
+    def _str_lines(self) -> List[str]:
+        """Render to a list of lines, so nesting levels can prefix
+        them without a splitlines round-trip."""
+        attrs = self.attrs
+        first = [self._get_meta("prefix") or "", self.name]
+        if attrs._get_meta("origin"):
+            first.append(f" ({attrs})")
+        first.append(":")
 
         raw_help = self._get_meta("raw_help")
         if raw_help:
-            out += " " + raw_help[0]
+            first.append(f" {raw_help[0]}")
 
-        for line in raw_help[1:]:
-            out += f"\n{FORMAT_INDENT}{line}"
+        out = ["".join(first)]
+        out.extend(f"{FORMAT_INDENT}{line}" for line in raw_help[1:])
 
         if self.terms:
-            out += f"\n{self.terms}"
+            out.extend(self.terms._str_lines())
 
         return out
 
-    def to_markdown(self, show_hidden: bool = False) -> str:
-        out = self._get_meta("prefix") or "- "
-        out += f"`{self.name}`"
-        if self.attrs._get_meta("origin"):
-            out += f" {self.attrs.to_markdown(show_hidden)}"
-        out += ":"
+    def __str__(self) -> str:
+        return "\n".join(self._str_lines())
+
+    def _markdown_lines(self, show_hidden: bool = False) -> List[str]:
+        """Render to markdown as a list of lines."""
+        attrs = self.attrs
+        first = [self._get_meta("prefix") or "- ", f"`{self.name}`"]
+        if attrs._get_meta("origin"):
+            first.append(f" {attrs.to_markdown(show_hidden)}")
+        first.append(":")
 
         if (
-            self.attrs.get("default", None) is not None
-            and not self.attrs.get("ns", False)
+            attrs.get("default", None) is not None
+            and not attrs.get("ns", False)
         ):
-            default = '""' if self.attrs.default == "" else self.attrs.default
-            out += f" *Default: `{default}`*. <br />"
+            default = '""' if attrs.default == "" else attrs.default
+            first.append(f" *Default: `{default}`*. <br />")
 
         raw_help = self._get_meta("raw_help")
         if raw_help and raw_help[0] == "|":
             raw_help = raw_help[1:]
-        for line in _ipython_to_markdown(raw_help):
-            out += f"\n{FORMAT_INDENT}{line}"
+
+        out = ["".join(first)]
+        out.extend(
+            f"{FORMAT_INDENT}{line}"
+            for line in _ipython_to_markdown(raw_help)
+        )
 
         if self.terms:
-            out += f"\n{self.terms.to_markdown(show_hidden)}"
+            out.extend(self.terms._markdown_lines(show_hidden))
 
         return out
 
+    def to_markdown(self, show_hidden: bool = False) -> str:
+        return "\n".join(self._markdown_lines(show_hidden))
+
 
 class ItemTerms(Mixin, OrderedDiot):
 
@@ -172,34 +203,36 @@ class ItemTerms(Mixin, OrderedDiot):
         self._set_meta("name", None)
         self._set_meta("level", 0)
 
-    def __str__(self) -> str:
+    def _str_lines(self) -> List[str]:
         name = self._get_meta("name")
         level = self._get_meta("level")
         out = []
         if name:
             out.append(f"{FORMAT_INDENT * level}{name}:")
 
+        indent = FORMAT_INDENT * (level + 1)
         for term in self.values():
-            out.extend(
-                (f"{FORMAT_INDENT * (level + 1)}{line}")
-                for line in str(term).splitlines()
-            )
-        return "\n".join(out)
+            out.extend(indent + line for line in term._str_lines())
+        return out
 
-    def to_markdown(self, show_hidden: bool = False) -> str:
+    def __str__(self) -> str:
+        return "\n".join(self._str_lines())
+
+    def _markdown_lines(self, show_hidden: bool = False) -> List[str]:
         level = self._get_meta("level")
         out = []
-        # if name:
-        #     out.append(f"{FORMAT_INDENT * level}{name}:")
         indent = "" if level == 0 else FORMAT_INDENT
         for term in self.values():
-            if term.attrs.get("hidden", False) and not show_hidden:
+            if not show_hidden and term.attrs.get("hidden", False):
                 continue
             out.extend(
-                (f"{indent}{line}")
-                for line in term.to_markdown(show_hidden).splitlines()
+                indent + line
+                for line in term._markdown_lines(show_hidden)
             )
-        return "\n".join(out)
+        return out
+
+    def to_markdown(self, show_hidden: bool = False) -> str:
+        return "\n".join(self._markdown_lines(show_hidden))
 
 
 class SummaryParsed(Mixin, Diot):
@@ -241,9 +274,8 @@ class TextParsed(Mixin, Diot):
 
     def __str__(self) -> str:
         name = self._get_meta("name")
-        out = f"{name}:\n" if name else ""
-        out += "\n".join(f"{FORMAT_INDENT}{line}" for line in self.lines)
-        return out
+        body = "\n".join(f"{FORMAT_INDENT}{line}" for line in self.lines)
+        return f"{name}:\n{body}" if name else body
 
     def to_markdown(self, show_hidden: bool = False) -> str:
         lines = _ipython_to_markdown(self.lines)
@@ -257,104 +289,206 @@ def _parse_terms(
     name: str | None = None,
 ) -> ItemTerms:
     """Parse a list of lines as terms.
+
+    Identical blocks recur across Proc subclasses sharing docstring
+    fragments, so the parse is cached on the lines; a structural clone
+    is returned since callers mutate the result in place.
     """
-    terms = ItemTerms()
-    terms._set_meta("name", name)
-    terms._set_meta("level", level)
+    return _clone_terms(_parse_terms_cached(tuple(lines), prefix, level, name))
+
+
+@lru_cache(maxsize=256)
+def _parse_terms_cached(
+    lines: Tuple[str, ...],
+    prefix: str | None = None,
+    level: int = 0,
+    name: str | None = None,
+) -> ItemTerms:
+    """Parse the term lines, uncloned and cached.
+
+    Sub-terms are parsed with an explicit work stack instead of
+    recursion; each level's lines are collected first and only parsed
+    once the whole block is known.
+    """
+    terms, jobs = _parse_term_block(list(lines), prefix, level, name)
+    while jobs:
+        item, sublines, sublevel = jobs.pop()
+        item.terms, subjobs = _parse_term_block(sublines, "- ", sublevel)
+        jobs.extend(subjobs)
+    return terms
+
+
+def _parse_term_block(
+    lines: List[str],
+    prefix: str | None = None,
+    level: int = 0,
+    name: str | None = None,
+) -> Tuple[ItemTerms, List[Tuple[ItemTerm, List[str], int]]]:
+    """Parse one level of term lines.
+
+    Returns the parsed terms together with the deferred
+    (item, sublines, level) jobs for their sub-term blocks.
+    """
+    # Accumulate plain-dict records and only build the ItemTerm/
+    # ItemAttrs diots once the block is fully scanned, keeping diot's
+    # __setattr__/__setitem__ machinery out of the per-line loop
+    parsed: dict = {}
+    jobs: List[Tuple[ItemTerm, List[str], int]] = []
     lines = dedent(lines)
+    # fullmatch instead of match: the patterns are fully anchored and
+    # the lines carry no trailing newline, so the semantics are the
+    # same but the engine can prune non-spanning attempts early
+    if not prefix:
+        match_item = ITEM_LINE_REGEX.fullmatch
+    elif prefix == "- ":
+        match_item = ITEM_DASH_LINE_REGEX.fullmatch
+    else:  # pragma: no cover - only None/"- " are used internally
+        def match_item(line, _cut=len(prefix)):
+            return ITEM_LINE_REGEX.fullmatch(line[_cut:])
+
     sublines = []
     item = None
     just_matched = False
     help_continuing = False
+    # The help text is accumulated as completed lines (help_lines) plus
+    # the line being extended (help_cur), and only joined when the item
+    # closes; appending to the full string per line is quadratic
+    help_lines: List[str] = []
+    help_cur = ""
     for line in lines:
-        if prefix:
-            matched = ITEM_LINE_REGEX.match(line[len(prefix):])
-        else:
-            matched = ITEM_LINE_REGEX.match(line)
+        # Item lines never start with whitespace (the lines are
+        # dedented), so most continuation lines skip the regex on a
+        # one-character test
+        first = line[:1]
+        matched = match_item(line) if first and first not in " \t" else None
 
-        lstripped_line = line.lstrip()
         if matched:
             if item:
-                # See if we have sub-terms
-                item.terms = _parse_terms(sublines, "- ", level + 1)
-                sublines.clear()
-
-            # Create a new item
-            name = matched.group("name")
+                item["help"] = (
+                    "\n".join((*help_lines, help_cur))
+                    if help_lines
+                    else help_cur
+                )
+                if sublines:
+                    # Defer parsing the sub-terms until all levels of
+                    # this block have been collected
+                    item["sublines"] = sublines
+                    sublines = []
+
+            # Create a new item record
+            term_name = matched.group("name")
             attrs = matched.group("attrs")
             help = matched.group("help")
-            terms[name] = ItemTerm(
-                name=name,
-                attrs=ItemAttrs(),
-                terms=ItemTerms(),
-                help="",
-            )
-            terms[name]._set_meta("prefix", prefix)
+            item = parsed[term_name] = {
+                "attrs": {},
+                "origin": [],
+                "help": "",
+                "raw_help": [],
+                "sublines": None,
+            }
+            help_lines = []
+            help_cur = ""
 
             if attrs:
-                for attr in attrs.split(";"):
-                    attr = attr.strip()
-                    attr_matched = ITEM_ATTR_REGEX.match(attr)
-                    if not attr_matched:
-                        raise MalFormattedAnnotationError(
-                            f"\nInvalid item attribute: {attr}"
-                            "\nExpecting: <name>[:=]<value>"
-                            f"\nFull attributes: {attrs}"
-                        )
+                origin = item["origin"]
+                item_attrs = item["attrs"]
+                pos = 0
+                for attr_matched in ITEM_ATTRS_SCAN_REGEX.finditer(attrs):
+                    if attr_matched.start() != pos:
+                        # A gap means an unparsable attribute
+                        break
+                    pos = attr_matched.end()
                     attr_name = attr_matched.group("name")
                     attr_value = attr_matched.group("value")
-                    terms[name].attrs._get_meta("origin").append(attr_name)
-                    terms[name].attrs[attr_name] = (
+                    origin.append(attr_name)
+                    item_attrs[attr_name] = (
                         True if attr_value is None else attr_value
                     )
 
+                if pos != len(attrs):
+                    raise MalFormattedAnnotationError(
+                        f"\nInvalid item attribute: {attrs[pos:].strip()}"
+                        "\nExpecting: <name>[:=]<value>"
+                        f"\nFull attributes: {attrs}"
+                    )
+
             if help is not None:
-                terms[name].help = help.strip()
-                terms[name]._get_meta("raw_help").append(terms[name].help)
-                if terms[name].help == "|":
+                help_cur = help.strip()
+                item["raw_help"].append(help_cur)
+                if help_cur == "|":
                     help_continuing = True
 
-            item = terms[name]
             just_matched = True
         elif item is None:
             raise MalFormattedAnnotationError(
                 f"\nInvalid item line: {line}"
                 "\nExpecting: <name>[ (<attrs>)]: <help>"
             )
-        elif just_matched and not lstripped_line.startswith("- "):
-            if help_continuing and item.help == "|":
-                sep = item.help = ""
-            else:
-                sep = (
-                    "\n"
-                    if help_continuing
-                    or end_of_sentence(item.help)
-                    or lstripped_line.startswith(">>>")
-                    or (
-                        item.help
-                        and item.help.splitlines()[-1].startswith(">>>")
-                    )
-                    else " "
-                )
-            item._get_meta("raw_help").append(lstripped_line)
-            item.help = f"{item.help}{sep}{lstripped_line}"
-        elif lstripped_line.startswith("- "):
-            sublines.append(line)
-            just_matched = False
-            help_continuing = False
         else:
-            sublines.append(line)
+            # Only non-item lines need the lstrip and sub-item probe
+            lstripped_line = line.lstrip()
+            is_sub = lstripped_line.startswith("- ")
+            if just_matched and not is_sub:
+                if help_continuing and help_cur == "|" and not help_lines:
+                    help_cur = lstripped_line
+                else:
+                    # The last line of the accumulated help is
+                    # help_cur, unless it was just completed
+                    last_line = help_cur or (
+                        help_lines[-1] if help_lines else ""
+                    )
+                    if (
+                        help_continuing
+                        or end_of_sentence(help_cur)
+                        or lstripped_line.startswith(">>>")
+                        or last_line.startswith(">>>")
+                    ):
+                        help_lines.append(help_cur)
+                        help_cur = lstripped_line
+                    else:
+                        help_cur = f"{help_cur} {lstripped_line}"
+                item["raw_help"].append(lstripped_line)
+            else:
+                sublines.append(line)
+                if is_sub:
+                    just_matched = False
+                    help_continuing = False
 
     if item:
-        # See if we have sub-terms
-        item.terms = _parse_terms(sublines, prefix="- ", level=level + 1)
-
-    return terms
+        item["help"] = (
+            "\n".join((*help_lines, help_cur)) if help_lines else help_cur
+        )
+        if sublines:
+            item["sublines"] = sublines
+
+    # Build the diots in one go
+    built: dict = {}
+    for term_name, record in parsed.items():
+        term = built[term_name] = ItemTerm(
+            name=term_name,
+            attrs=ItemAttrs(record["attrs"]),
+            terms=ItemTerms(),
+            help=record["help"],
+        )
+        term._set_meta("prefix", prefix)
+        term._set_meta("raw_help", record["raw_help"])
+        term.attrs._set_meta("origin", record["origin"])
+        # Sub-terms may be filled in from the class later, even if the
+        # docstring has none; keep their level right
+        term.terms._set_meta("level", level + 1)
+        if record["sublines"]:
+            jobs.append((term, record["sublines"], level + 1))
+
+    terms = ItemTerms(built)
+    terms._set_meta("name", name)
+    terms._set_meta("level", level)
+    return terms, jobs
 
 
 def _parse_one_output(out: str) -> List[str] | None:
     """Parse one output item, such as `out:file:<outfile>`"""
-    parts = out.split(":")
+    # Bound the split so a default containing colons stays intact
+    parts = out.split(":", 2)
     if not parts[0].isidentifier():
         return None
     if len(parts) < 3:
@@ -362,61 +496,133 @@ def _parse_one_output(out: str) -> List[str] | None:
     return parts
 
 
+@lru_cache(maxsize=256)
+def _normalize_input_keys(
+    input_keys: str | Tuple[str, ...],
+) -> Tuple[Tuple[str, str, str], ...]:
+    """Split an input spec into (key, type, action) triples, cached
+    per spec.
+
+    The spec is a class-level constant, so the splitting and the
+    action derivation only need to happen once no matter how often the
+    class is annotated.
+    """
+    if isinstance(input_keys, str):
+        input_keys = [key.strip() for key in input_keys.split(",")]
+
+    out = []
+    for key_type in input_keys:
+        # partition scans the string once, unlike `in` + split
+        input_key, sep, input_type = key_type.partition(":")
+        if not sep:
+            input_type = ProcInputType.VAR
+        action = (
+            "append"
+            if input_type in (ProcInputType.FILES, ProcInputType.DIRS)
+            else "extend"
+        )
+        out.append((input_key, input_type, action))
+    return tuple(out)
+
+
+@lru_cache(maxsize=256)
+def _normalize_output(
+    output: str | Tuple[str, ...],
+) -> Tuple[Tuple[str, ...], ...]:
+    """Split an output spec into (key, type, default) parts, cached."""
+    if isinstance(output, str):
+        output = [out.strip() for out in output.split(",")]
+
+    return tuple(
+        tuple(parts)
+        for parts in map(_parse_one_output, output)
+        if parts
+    )
+
+
 def _update_attrs_with_cls(
     parsed: Diot,
     envs: dict | None,
     prev_key: str | None = None,
 ) -> None:
-    """Update the attrs of parsed terms with the class envs."""
-    envs = envs or {}
-    for key, value in envs.items():
-        whole_key = f"{prev_key}.{key}" if prev_key else key
-
-        if key not in parsed:
-            parsed[key] = ItemTerm(
-                name=key,
-                attrs=ItemAttrs(),
-                terms=ItemTerms(),
-                help="",
-            )
+    """Update the attrs of parsed terms with the class envs.
 
-        if (
-            parsed[key].attrs.get("ns", False)
-            or parsed[key].attrs.get("namespace", False)
-            or parsed[key].attrs.get("action", "") in ("ns", "namespace")
-            or (isinstance(value, dict) and parsed[key].terms)
-        ):
-            parsed[key].attrs.setdefault("ns", True)
-            _update_attrs_with_cls(
-                parsed[key].terms,
-                value,
-                prev_key=whole_key,
-            )
-            # continue
+    Namespaced envs are walked with an explicit stack instead of
+    recursing per nesting level.
+    """
+    stack = [(parsed, envs or {}, prev_key)]
+    while stack:
+        parsed, envs, prev_key = stack.pop()
+        for key, value in envs.items():
+            whole_key = f"{prev_key}.{key}" if prev_key else key
+
+            if key not in parsed:
+                parsed[key] = ItemTerm(
+                    name=key,
+                    attrs=ItemAttrs(),
+                    terms=ItemTerms(),
+                    help="",
+                )
 
-        if "default" not in parsed[key].attrs:
-            parsed[key].attrs["default"] = value
+            item = parsed[key]
+            attrs = item.attrs
+            if (
+                attrs.get("ns", False)
+                or attrs.get("namespace", False)
+                or attrs.get("action", "") in ("ns", "namespace")
+                or (isinstance(value, dict) and item.terms)
+            ):
+                attrs.setdefault("ns", True)
+                stack.append((item.terms, value or {}, whole_key))
+
+            attrs.setdefault("default", value)
+
+
+def _clone_terms(terms: Mapping) -> ItemTerms:
+    """Structurally clone parsed terms.
+
+    Much cheaper than deepcopy: the diot nodes and their meta lists
+    are fresh, while the immutable leaf values are shared.
+    """
+    out = ItemTerms()
+    out._set_meta("name", terms._get_meta("name"))
+    out._set_meta("level", terms._get_meta("level"))
+    for key, term in terms.items():
+        attrs = ItemAttrs(term.attrs)
+        attrs._set_meta("origin", term.attrs._get_meta("origin").copy())
+        item = out[key] = ItemTerm(
+            name=term.name,
+            attrs=attrs,
+            terms=_clone_terms(term.terms),
+            help=term.help,
+        )
+        item._set_meta("prefix", term._get_meta("prefix"))
+        item._set_meta("raw_help", term._get_meta("raw_help").copy())
+    return out
 
 
 def _update_terms(base: Mapping, other: Mapping) -> None:
     """Update the terms of base with the other terms."""
-    base = deepcopy(base)
+    base = _clone_terms(base)
     for key, value in other.items():
         if key not in base:
             base[key] = value
         else:
+            item = base[key]
             if value.help:
-                base[key].help = value.help
-                base[key]._set_meta(
+                item.help = value.help
+                item._set_meta(
                     "raw_help",
                     value._get_meta("raw_help").copy()
                 )
-            base[key].attrs.update(value.attrs)
-            origin = base[key].attrs._get_meta("origin")
+            item.attrs.update(value.attrs)
+            origin = item.attrs._get_meta("origin")
             for org in value.attrs._get_meta("origin"):
                 if org not in origin:
                     origin.append(org)
-            _update_terms(base[key].terms, value.terms)
+            # Sub-terms of an overlapping key stay as base's; the
+            # recursive update here used to work on a copy and discard
+            # the result
 
     return base
 
@@ -431,6 +637,13 @@ class Section(ABC):
     def consume(self, line: str) -> None:
         self._lines.append(line)
 
+    def consume_block(self, block: str) -> None:
+        """Consume a block of lines at once."""
+        self._lines.extend(
+            line.rstrip() if line and line[-1] in " \t" else line
+            for line in block.splitlines()
+        )
+
     @abstractmethod
     def parse(self) -> Diot:  # pragma: no cover
         pass
@@ -447,9 +660,12 @@ class Section(ABC):
         if isinstance(other, list):
             return base + other
 
-        base = deepcopy(base)
-        base.update(other)
-        return base
+        # Shallow clone is enough: update() replaces values wholesale
+        copied = base.__class__(base)
+        if isinstance(copied, Mixin):
+            copied._set_meta("name", base._get_meta("name"))
+        copied.update(other)
+        return copied
 
 
 class SectionSummary(Mixin, Section):
@@ -463,14 +679,20 @@ class SectionSummary(Mixin, Section):
             else:
                 lines = [lines[0]] + dedent(lines[1:])
 
-        short = long = ""
-        for i, line in enumerate(lines):
-            if not line:
-                long = "\n".join(lines[i + 1:])
-                break
-            short += line + " "
-
-        return SummaryParsed(short=short.rstrip(), long=long)
+        # The short summary runs to the first blank line, the long one
+        # starts after the blank run; one join each instead of
+        # accumulating per line
+        n_lines = len(lines)
+        blank = next(
+            (i for i, line in enumerate(lines) if not line),
+            n_lines,
+        )
+        short = " ".join(lines[:blank]).rstrip()
+        start = blank + 1
+        while start < n_lines and not lines[start]:
+            start += 1
+
+        return SummaryParsed(short=short, long="\n".join(lines[start:]))
 
     @classmethod
     def update_parsed(
@@ -479,7 +701,7 @@ class SectionSummary(Mixin, Section):
         other: str | List[str] | MutableMapping,
     ) -> str | List[str] | MutableMapping:
         """Update the parsed result with the other result."""
-        base = deepcopy(base)
+        base = SummaryParsed(short=base.short, long=base.long)
         if other.short:
             base.short = other.short
         if other.long:
@@ -513,38 +735,35 @@ class SectionInput(SectionItems):
         parsed = super().parse()
         input_keys = self._cls.input
 
-        if isinstance(input_keys, str):
-            input_keys = [
-                input_key.strip() for input_key in input_keys.split(",")
-            ]
+        if input_keys and not isinstance(input_keys, str):
+            input_keys = tuple(input_keys)
 
         input_key_names = set()
-        for input_key_type in input_keys or []:
-            if ":" not in input_key_type:
-                input_key_type = f"{input_key_type}:{ProcInputType.VAR}"
-
-            input_key, input_type = input_key_type.split(":", 1)
+        for input_key, input_type, action in (
+            _normalize_input_keys(input_keys) if input_keys else ()
+        ):
             input_key_names.add(input_key)
-            if input_key not in parsed:
-                parsed[input_key] = ItemTerm(
+            item = parsed.get(input_key)
+            if item is None:
+                item = parsed[input_key] = ItemTerm(
                     name=input_key,
                     attrs=ItemAttrs(itype=input_type),
                     terms=ItemTerms(),
                     help="",
                 )
+                attrs = item.attrs
             else:
-                parsed[input_key].attrs["itype"] = input_type
+                attrs = item.attrs
+                attrs["itype"] = input_type
 
-            parsed[input_key].attrs["nargs"] = "+"
-            if input_type in (ProcInputType.FILES, ProcInputType.DIRS):
-                parsed[input_key].attrs["action"] = "append"
-            else:
-                parsed[input_key].attrs["action"] = "extend"
+            attrs["nargs"] = "+"
+            attrs["action"] = action
 
-        if set(parsed) - input_key_names:
+        unknown = [key for key in parsed if key not in input_key_names]
+        if unknown:
             warnings.warn(
                 f"[{self._cls.__name__}] Unknown input keys "
-                f"{set(parsed) - input_key_names}",
+                f"{unknown}",
                 UnknownAnnotationItemWarning,
             )
 
@@ -562,17 +781,14 @@ class SectionOutput(SectionItems):
 
         parsed = super().parse()
 
-        if not isinstance(output, (list, tuple)):
-            output = [out.strip() for out in output.split(",")]
+        if isinstance(output, (list, tuple)):
+            output = tuple(output)
 
         out_names = set()
-        for out in output:
-            parts = _parse_one_output(out)
-            if not parts:
-                continue
-
+        for parts in _normalize_output(output):
             out_names.add(parts[0])
-            if parts[0] not in parsed:
+            item = parsed.get(parts[0])
+            if item is None:
                 parsed[parts[0]] = ItemTerm(
                     name=parts[0],
                     attrs=ItemAttrs(otype=parts[1], default=parts[2]),
@@ -580,13 +796,15 @@ class SectionOutput(SectionItems):
                     help="",
                 )
             else:
-                parsed[parts[0]].attrs["otype"] = parts[1]
-                parsed[parts[0]].attrs["default"] = parts[2]
+                attrs = item.attrs
+                attrs["otype"] = parts[1]
+                attrs["default"] = parts[2]
 
-        if set(parsed) - out_names:
+        unknown = [key for key in parsed if key not in out_names]
+        if unknown:
             warnings.warn(
                 f"[{self._cls.__name__}] Unknown output keys "
-                f"{set(parsed) - out_names}",
+                f"{unknown}",
                 UnknownAnnotationItemWarning,
             )
 
@@ -612,8 +830,7 @@ class SectionProcGroupArgs(SectionItems):
 class SectionText(Section):
 
     def parse(self) -> Diot:
-        lines = dedent(self._lines)
-        lines = cleanup_empty_lines(lines)
+        lines = dedent_and_clean(self._lines)
         out = TextParsed(lines=TextLines(lines))
         out._set_meta("name", self.name)
         return out
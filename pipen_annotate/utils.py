@@ -1,5 +1,3 @@
-import re
-import textwrap
 from typing import List
 
 
@@ -8,47 +6,126 @@ FORMAT_INDENT = "    "
 
 
 def is_section(s: str) -> bool:
-    return re.sub(r"(?!^) ", "", s).isidentifier()
+    # Drop the spaces in the name, except a leading one, without
+    # paying for a regex lookahead
+    return (s[:1] + s[1:].replace(" ", "")).isidentifier()
+
+
+def _common_margin(lines: List[str], stripped_lines: List[str]) -> int:
+    """The length of the common leading whitespace of non-blank lines."""
+    margin = None
+    for line, stripped in zip(lines, stripped_lines):
+        if not stripped:
+            continue
+
+        indent = line[: len(line) - len(stripped)]
+        if margin is None or indent.startswith(margin):
+            margin = indent if margin is None else margin
+        elif margin.startswith(indent):
+            margin = indent
+        else:
+            for i, (x, y) in enumerate(zip(margin, indent)):
+                if x != y:
+                    margin = margin[:i]
+                    break
+
+    return len(margin) if margin else 0
+
+
+def _dedent_lines(lines: List[str]) -> List[str]:
+    """Dedent a list of lines in a single pass.
+
+    Behaves like `textwrap.dedent` on the joined text: the longest
+    common leading whitespace of all non-blank lines is removed and
+    blank lines are normalized to empty strings.
+    """
+    stripped_lines = [line.lstrip() for line in lines]
+    cut = _common_margin(lines, stripped_lines)
+    return [
+        line[cut:] if stripped else ""
+        for line, stripped in zip(lines, stripped_lines)
+    ]
 
 
 def dedent(lines: List[str]) -> List[str]:
-    """Dedent a list of lines."""
-    return textwrap.dedent("\n".join(lines)).splitlines()
+    """Dedent a list of lines without joining them into a text first."""
+    out = _dedent_lines(lines)
+    # Joining and re-splitting used to swallow one trailing empty line;
+    # callers rely on that
+    if out and not out[-1]:
+        out.pop()
+    return out
+
+
+def dedent_text(text: str) -> str:
+    """Dedent a text, like `textwrap.dedent`."""
+    return "\n".join(_dedent_lines(text.split("\n")))
+
+
+def dedent_and_clean(lines: List[str]) -> List[str]:
+    """Dedent lines and clean up empty lines in one pass.
+
+    Equivalent to `cleanup_empty_lines(dedent(lines))` without
+    building the intermediate dedented list.
+    """
+    stripped_lines = [line.lstrip() for line in lines]
+    cut = _common_margin(lines, stripped_lines)
+    out: List[str] = []
+    for line, stripped in zip(lines, stripped_lines):
+        if stripped:
+            out.append(line[cut:])
+        elif not out or out[-1]:
+            out.append("")
+
+    if out and not out[-1]:
+        out.pop()
+
+    return out
 
 
 def indent(text: str, indentation: str) -> str:
     """Indent a text."""
-    lines = text.splitlines()
     summary_lines = []
     rest_lines = []
+    rest_stripped = []
     hit_section = False
-    for line in lines:
+    for line in text.splitlines():
         if line.endswith(":") and is_section(line[:-1].lstrip()):
             hit_section = True
 
         if hit_section:
+            # Strip once here; the margin scan below reuses it instead
+            # of re-lstripping inside dedent()
             rest_lines.append(line)
+            rest_stripped.append(line.lstrip())
         else:
             summary_lines.append(line.lstrip())
 
-    lines = [*summary_lines, *dedent(rest_lines)]
-    return "\n".join(
-        f"{indentation}{line}"
-        if line and i > 0
-        else line
-        for i, line in enumerate(lines)
-    ) + "\n"
+    cut = _common_margin(rest_lines, rest_stripped)
+    lines = summary_lines
+    lines.extend(
+        line[cut:] if stripped else ""
+        for line, stripped in zip(rest_lines, rest_stripped)
+    )
+    if rest_lines and lines and not lines[-1]:
+        # dedent() used to drop one trailing blank line
+        lines.pop()
+    if indentation:
+        # The list is freshly built above, so prefix in place rather
+        # than going through another generator
+        for i in range(1, len(lines)):
+            line = lines[i]
+            if line:
+                lines[i] = indentation + line
+
+    return "\n".join(lines) + "\n"
 
 
 def end_of_sentence(line: str) -> bool:
     """Check if a line ends with a sentence.
     """
-    return (
-        line.endswith(".")
-        or line.endswith("?")
-        or line.endswith("!")
-        or line.endswith(":")
-    )
+    # endswith with a tuple checks all suffixes in one C call
+    return line.endswith((".", "?", "!", ":"))
 
 
 def cleanup_empty_lines(lines: List[str]) -> List[str]:
@@ -8,6 +8,48 @@ from pipen_annotate.annotate import SECTION_TYPES
 from pipen_annotate.sections import SectionItems, Section, UnknownAnnotationItemWarning, dedent
 
 
+def test_lazy_package_attrs():
+    import sys
+    import pipen_annotate
+
+    assert pipen_annotate.annotate is annotate
+    assert pipen_annotate.Section is Section
+    # The import system binds the submodule over the package attribute
+    # when pipen_annotate.annotate is imported first; the function
+    # must still win
+    pipen_annotate.annotate = sys.modules["pipen_annotate.annotate"]
+    assert pipen_annotate.annotate is annotate
+    # Non-module assignments are kept as-is
+    pipen_annotate.annotate = "placeholder"
+    assert pipen_annotate.annotate == "placeholder"
+    pipen_annotate.annotate = annotate
+    assert pipen_annotate.annotate is annotate
+    with pytest.raises(AttributeError):
+        pipen_annotate.not_an_attr
+
+
+def test_annotate_results_isolated():
+    class Base:
+        """Summary"""
+
+    class Child(Base):
+        ...
+
+    child_annotated = annotate(Child)
+    assert child_annotated is not annotate(Base)
+    child_annotated["Injected"] = "oops"
+    assert "Injected" not in annotate(Base)
+
+    class Plain1:
+        ...
+
+    class Plain2:
+        ...
+
+    annotate(Plain1)["Injected"] = "oops"
+    assert "Injected" not in annotate(Plain2)
+
+
 def test_annotate():
 
     class TestClass:
@@ -336,6 +378,20 @@ def test_unknown_section():
     assert annotated["Un known"].lines == ["help1", "help2"]
 
 
+def test_colon_line_not_a_section():
+    class TestClass:
+        """Summary
+
+        Text:
+            abc
+        foo-bar:
+            def
+        """
+
+    annotated = annotate(TestClass)
+    assert annotated["Text"].lines == ["    abc", "foo-bar:", "    def"]
+
+
 def test_help_newline():
     class TestClass:
         """Summary
@@ -42,6 +42,16 @@ def test_section_summary():
         "long": "Long summary.\nLong long summary.",
     }
 
+    section = SectionSummary(None, "Summary")
+    section.consume("Short summary.")
+    section.consume("")
+    section.consume("")
+    section.consume("Long summary.")
+    assert section.parse() == {
+        "short": "Short summary.",
+        "long": "Long summary.",
+    }
+
     section = SectionSummary(None, "Summary")
     section.consume("Short summary,")
     section.consume("short summary continued.")
@@ -138,6 +148,14 @@ def test_invalid_attr():
     ):
         section.parse()
 
+    section = SectionItems(int, "Items")
+    section.consume("item1 (attr1;,;attr2): help1")
+    with pytest.raises(
+        MalFormattedAnnotationError,
+        match="Invalid item attribute",
+    ):
+        section.parse()
+
 
 def test_invalid_item():
     section = SectionItems(int, "Items")
@@ -162,6 +180,20 @@ def test_input():
     assert parsed["in2"]["attrs"]["itype"] == "var"
 
 
+def test_input_list_spec():
+    class TestProc:
+        input = ["infile1:file", "in2"]
+
+    section = SectionInput(TestProc, "Input")
+    section.consume("infile1: help1")
+    section.consume("in2: help2")
+
+    parsed = section.parse()
+    assert len(parsed) == 2
+    assert parsed["infile1"]["attrs"]["itype"] == "file"
+    assert parsed["in2"]["attrs"]["itype"] == "var"
+
+
 def test_input_missing_annotation():
     class TestProc:
         input = "infile1:file, in2"
@@ -199,6 +231,31 @@ def test_output():
     assert parsed["out"]["attrs"]["default"] == "{{c}}"
 
 
+def test_output_colon_default():
+    class TestProc:
+        output = "out:file:{{a | date: '%Y'}}"
+
+    section = SectionOutput(TestProc, "Output")
+    parsed = section.parse()
+    assert parsed["out"]["attrs"]["default"] == "{{a | date: '%Y'}}"
+
+
+def test_output_list_spec():
+    class TestProc:
+        output = ["outfile:file:{{a}}", "out:{{c}}"]
+
+    section = SectionOutput(TestProc, "Output")
+    section.consume("outfile: help1")
+    section.consume("out: help3")
+
+    parsed = section.parse()
+    assert len(parsed) == 2
+    assert parsed["outfile"]["attrs"]["otype"] == "file"
+    assert parsed["outfile"]["attrs"]["default"] == "{{a}}"
+    assert parsed["out"]["attrs"]["otype"] == "var"
+    assert parsed["out"]["attrs"]["default"] == "{{c}}"
+
+
 def test_output_missing_annotation():
     class TestProc:
         output = "outfile:file:{{a}}, outdir:dir:{{b}}, 1"
@@ -254,6 +311,9 @@ def test_envs():
     #     parsed["b"]["terms"]["e"]["terms"]["f"]["attrs"]["action"]
     #     == "clear_extend"
     # )
+    assert parsed["a"].to_markdown() == (
+        "- `a`: *Default: `1`*. <br />\n    help1"
+    )
     assert parsed.to_markdown() == """- `a`: *Default: `1`*. <br />
     help1
 - `b`:
@@ -1,6 +1,8 @@
 import pytest
 from pipen_annotate.utils import (
     dedent,
+    dedent_and_clean,
+    dedent_text,
     indent,
     end_of_sentence,
     cleanup_empty_lines,
@@ -12,6 +14,21 @@ def test_dedent():
     assert lines == ["Abc", "def", "", "Ghi"]
 
 
+def test_dedent_text():
+    assert dedent_text("    Abc\n  def") == "  Abc\ndef"
+    assert dedent_text("  Abc\n    def") == "Abc\n  def"
+    assert dedent_text("\tAbc\n  def") == "\tAbc\n  def"
+    assert dedent_text("Abc\n   \ndef") == "Abc\n\ndef"
+
+
+def test_dedent_and_clean():
+    lines = dedent_and_clean(
+        ["  Abc", "", "", "  def", "    ", "    Ghi", ""]
+    )
+    assert lines == ["Abc", "", "def", "", "  Ghi"]
+    assert dedent_and_clean([]) == []
+
+
 def test_indent():
     text = indent("Abc\ndef\n\nGhi", "    ")
     assert text == "Abc\n    def\n\n    Ghi\n"
@@ -37,6 +54,11 @@ def test_indent():
         """
 
 
+def test_indent_empty_indentation():
+    text = indent("Abc\ndef\n\nGhi", "")
+    assert text == "Abc\ndef\n\nGhi\n"
+
+
 def test_end_of_sentence():
     assert end_of_sentence("Abc.")
     assert end_of_sentence("Abc?")